@@ -14,7 +14,8 @@ load_dotenv()
 
 # Constants
 MAX_JOBS = 6  # Maximum number of job links to display
-RESULTS_FILE = "interview_results.json"
+META_FILE = "interview_meta.json"
+ANSWERS_FILE = "interview_answers.jsonl"
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -29,14 +30,25 @@ except Exception as e:
 
 @st.cache_data(show_spinner=False)
 def load_results() -> Optional[Dict]:
-    """Load interview results from JSON file with validation"""
+    """Rebuild interview results from the metadata file and answers log"""
     try:
-        if not os.path.exists(RESULTS_FILE):
+        if not os.path.exists(META_FILE):
             st.error("No interview results file found")
             return None
             
-        with open(RESULTS_FILE) as f:
+        with open(META_FILE) as f:
             data = json.load(f)
+        
+        # Later lines win if a question was answered more than once
+        answers = {"hr": {}, "tech": {}}
+        if os.path.exists(ANSWERS_FILE):
+            with open(ANSWERS_FILE) as f:
+                for line in f:
+                    if line.strip():
+                        record = json.loads(line)
+                        answers[record.pop("round")][record.pop("idx")] = record
+        data["hr_results"] = [answers["hr"][idx] for idx in sorted(answers["hr"])]
+        data["tech_results"] = [answers["tech"][idx] for idx in sorted(answers["tech"])]
             
         # Validate basic structure
         if not all(key in data for key in ['domain', 'hr_results', 'tech_results']):
@@ -1,12 +1,132 @@
 import os
-from groq import Groq
-from dotenv import load_dotenv
+import re
+import logging
+import shelve
+import hashlib
+import time
+import threading
+import streamlit as st
+from groq_client import get_client
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL = "llama-3.1-8b-instant"
+LARGE_MODEL = "llama-3.3-70b-versatile"
+CACHE_FILE = "domain_cache.db"
+CACHE_MAX_ENTRIES = 1000
+CACHE_TTL_SECONDS = 7 * 24 * 3600  # entries older than a week are ignored and evicted
+
+# Job titles sit near the top (or in a closing "role" section), so the
+# middle of long descriptions is dropped to keep the prompt short
+JD_HEAD_CHARS = 2000
+JD_TAIL_CHARS = 500
+_BOILERPLATE_RE = re.compile(r'equal opportunity|benefits include|apply now', re.I)
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+|\n+')
+
+# Streamlit sessions run on parallel threads and shelve has no locking of its own
+_disk_cache_lock = threading.Lock()
+
+class _UnknownDomain(Exception):
+    """Raised inside the cached lookup so failed predictions are not cached"""
+
+def _read_title(stream, max_chars: int = 60) -> str:
+    """
+    Collect streamed tokens until the title is followed by a newline or
+    max_chars is reached, then close the stream. Leading whitespace and
+    blank lines are skipped, so only a newline after some text ends the title
+    """
+    text = ""
+    try:
+        for chunk in stream:
+            delta = chunk.choices[0].delta.content
+            if delta:
+                text = (text + delta).lstrip()
+                if '\n' in text or len(text) > max_chars:
+                    break
+    finally:
+        stream.close()
+    return text.split('\n', 1)[0]
+
+def _summarize_jd(job_description: str) -> str:
+    """Drop boilerplate sentences, keep the head and tail, and collapse whitespace"""
+    sentences = _SENTENCE_SPLIT_RE.split(job_description)
+    text = "\n".join(s for s in sentences if not _BOILERPLATE_RE.search(s))
+    # Keep the original if filtering removed most of it
+    if len(text.strip()) < len(job_description.strip()) // 4:
+        text = job_description
+    if len(text) > JD_HEAD_CHARS + JD_TAIL_CHARS:
+        text = text[:JD_HEAD_CHARS] + "...\n" + text[-JD_TAIL_CHARS:]
+    return re.sub(r'\s+', ' ', text).strip()
+
+def _use_large_model() -> bool:
+    """True only for explicit opt-in values, so "0" or "false" keep the default model"""
+    return os.getenv("EVALIA_USE_LARGE_MODEL", "").strip().lower() in {"1", "true", "yes"}
+
+def _cache_key(job_description: str) -> str:
+    """Hash of the selected model and the lowercased, whitespace-collapsed job description"""
+    model = LARGE_MODEL if _use_large_model() else DEFAULT_MODEL
+    normalized = re.sub(r'\s+', ' ', job_description.strip().lower())
+    return hashlib.blake2b(f"{model}\n{normalized}".encode(), digest_size=16).hexdigest()
+
+def _entry_age(entry) -> float:
+    """Seconds since a disk cache entry was saved; infinite for malformed entries"""
+    if not isinstance(entry, dict) or "saved_at" not in entry:
+        return float("inf")
+    return time.time() - entry["saved_at"]
+
+def _read_disk_cache(key: str):
+    """Return the cached domain for key, or None if missing or expired"""
+    try:
+        with _disk_cache_lock, shelve.open(CACHE_FILE) as disk_cache:
+            entry = disk_cache.get(key)
+    except Exception as e:
+        logger.warning("Error reading domain cache: %s", e)
+        return None
+    if _entry_age(entry) > CACHE_TTL_SECONDS:
+        return None
+    return entry["domain"]
+
+def _write_disk_cache(key: str, domain: str) -> None:
+    """Store a domain; once over the cap, drop expired and then the oldest entries"""
+    try:
+        with _disk_cache_lock, shelve.open(CACHE_FILE) as disk_cache:
+            disk_cache[key] = {"domain": domain, "saved_at": time.time()}
+            if len(disk_cache) <= CACHE_MAX_ENTRIES:
+                return
+            entries = sorted(((_entry_age(disk_cache[k]), k) for k in list(disk_cache.keys())), reverse=True)
+            for age, k in entries:
+                if age <= CACHE_TTL_SECONDS and len(disk_cache) <= CACHE_MAX_ENTRIES:
+                    break
+                del disk_cache[k]
+    except Exception as e:
+        logger.warning("Error writing domain cache: %s", e)
 
-load_dotenv()
-    
 def predict_domain(job_description: str) -> str:
+    """Predict the job domain, reusing cached results for repeated descriptions"""
     try:
-        client = Groq(api_key=os.getenv("GROQ_API_KEY"))
+        return _cached_predict_domain(_cache_key(job_description), job_description)
+    except _UnknownDomain:
+        return "Unknown"
+
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def _cached_predict_domain(key: str, _job_description: str) -> str:
+    """
+    Process-wide cache keyed only by the job description hash
+    (the leading underscore keeps Streamlit from hashing the raw text).
+    Falls back to the on-disk cache, then to Groq.
+    """
+    domain = _read_disk_cache(key)
+    if not domain:
+        domain = _predict_domain_uncached(_job_description)
+        if not domain or domain == "Unknown":
+            raise _UnknownDomain()
+        _write_disk_cache(key, domain)
+
+    return domain
+
+def _predict_domain_uncached(job_description: str) -> str:
+    try:
+        client = get_client()
 
         prompt = f"""
         Analyze the following job description and predict the most appropriate job title/domain.
@@ -14,33 +134,39 @@ def predict_domain(job_description: str) -> str:
         Do NOT include punctuation, explanation, or extra text.
 
         Job Description:
-        {job_description}
+        {_summarize_jd(job_description)}
         """
 
-        # Try main model first
-        try:
-            response = client.chat.completions.create(
-                messages=[{"role": "user", "content": prompt}],
-                model="llama-3.3-70b-versatile",   # ✅ Updated
-                temperature=0.3,
-                max_tokens=50
-            )
-        except Exception as e:
-            print("Primary model failed, trying fallback...", e)
+        # The small model is enough to emit a job title; the large one is opt-in
+        response = None
+        if _use_large_model():
+            try:
+                response = client.chat.completions.create(
+                    messages=[{"role": "user", "content": prompt}],
+                    model=LARGE_MODEL,
+                    temperature=0.0,
+                    max_tokens=12,
+                    stream=True
+                )
+            except Exception as e:
+                logger.warning("Large model failed, trying default: %s", e)
+
+        if response is None:
             response = client.chat.completions.create(
                 messages=[{"role": "user", "content": prompt}],
-                model="llama-3.1-8b-instant",       # ✅ Fallback
-                temperature=0.3,
-                max_tokens=50
+                model=DEFAULT_MODEL,
+                temperature=0.0,
+                max_tokens=12,
+                stream=True
             )
 
-        raw_output = response.choices[0].message.content
-        print("Raw output:", raw_output)
+        raw_output = _read_title(response)
+        logger.debug("Raw output: %s", raw_output)
 
         domain = raw_output.strip().strip('"')
         return domain
 
     except Exception as e:
-        print(f"Error predicting domain: {e}")
+        logger.error("Error predicting domain: %s", e)
         return "Unknown"
 
@@ -0,0 +1,19 @@
+import os
+import threading
+from groq import Groq
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# One Groq client per process so every caller shares its HTTP connection pool
+_client = None
+_client_lock = threading.Lock()
+
+def get_client() -> Groq:
+    """Return the shared Groq client, creating it on first use"""
+    global _client
+    # Called from background workers too, so creation is guarded
+    with _client_lock:
+        if _client is None:
+            _client = Groq(api_key=os.getenv("GROQ_API_KEY"))
+    return _client
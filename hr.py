@@ -124,6 +124,16 @@ class HRInterview:
                 ]
             }
 
+    def warm_up(self) -> None:
+        """
+        Make a lightweight request so the client's connection to Groq is open
+        before evaluate_answer() is called for the recorded HR answer
+        """
+        try:
+            self.client.models.list()
+        except Exception as e:
+            print(f"Error warming up HR client: {str(e)}")
+
     def _parse_evaluation(self, text: str) -> Dict:
         """
         Parse LLM evaluation response into structured format
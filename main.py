@@ -1,95 +1,394 @@
 import os
+import re
 import json
+import queue
+import atexit
 import logging
+from logging.handlers import QueueHandler, QueueListener
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
 import streamlit as st
 from voice import VoiceProcessor
 from domain import predict_domain
 from hr import HRInterview
 from tech import TechnicalInterview
+from questions import generate_all_questions
 from dashboard import display_dashboard
 from chatbot import chatbot_page
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+META_FILE = "interview_meta.json"
+ANSWERS_FILE = "interview_answers.jsonl"
+_ALPHA_RE = re.compile(r'[^\W\d_]')  # any letter, like str.isalpha
+
+def configure_logging() -> None:
+    """
+    Route log records through a queue so file and console I/O happen on a
+    background thread instead of blocking the Streamlit script thread.
+    
+    Streamlit re-executes this module on every rerun, so the listener is
+    only started once per process.
+    """
+    root = logging.getLogger()
+    if any(isinstance(handler, QueueHandler) for handler in root.handlers):
+        return
+    
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    file_handler = logging.FileHandler("interview_app.log")
+    stream_handler = logging.StreamHandler()
+    file_handler.setFormatter(formatter)
+    stream_handler.setFormatter(formatter)
+    
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, file_handler, stream_handler)
+    listener.start()
+    atexit.register(listener.stop)
+    
+    # force=True replaces handlers installed by modules imported earlier
+    logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(log_queue)], force=True)
+
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("interview_app.log"),
-        logging.StreamHandler()
-    ]
-)
+configure_logging()
 logger = logging.getLogger(__name__)
 
+@st.cache_resource
+def load_components() -> Tuple[VoiceProcessor, HRInterview, TechnicalInterview]:
+    """
+    Create the speech and interview components once per process.
+    
+    Streamlit re-executes this script on every rerun; caching keeps the same
+    clients (and their warmed connection pools) across reruns and sessions.
+    """
+    return VoiceProcessor(), HRInterview(), TechnicalInterview()
+
 # Initialize all components
 try:
-    voice_processor = VoiceProcessor()
-    hr_interview = HRInterview()
-    tech_interview = TechnicalInterview()
+    voice_processor, hr_interview, tech_interview = load_components()
 except Exception as e:
     logger.error(f"Failed to initialize components: {str(e)}")
     st.error("Failed to initialize application components. Please try again later.")
     st.stop()
 
-def save_results(results: dict) -> bool:
+@st.cache_resource
+def get_executor() -> ThreadPoolExecutor:
     """
-    Save interview results to JSON file.
+    Shared worker pool for background Groq calls.
+    
+    Cached as a resource so a single pool is reused across sessions and
+    reruns. Tasks submitted here must not wait on other tasks in the pool.
+    """
+    return ThreadPoolExecutor(max_workers=4)
+
+def _dumps(data: dict, indent: bool = False) -> bytes:
+    """Serialize to JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, indent=2 if indent else None).encode("utf-8")
+
+def save_interview_meta(results: dict) -> bool:
+    """
+    Save the interview header (domain and question lists) and reset answers.
+    
+    Called once per interview when the questions are ready. Writes through a
+    temporary file that is atomically moved into place, so a failed save never
+    leaves a partial file. Per-question records go to the answers log via
+    append_answer().
     
     Args:
-        results (dict): Dictionary containing interview results to be saved
+        results (dict): Dictionary containing interview results
         
     Returns:
         bool: True if save was successful, False otherwise
+    """
+    try:
+        meta = {
+            "domain": results["domain"],
+            "hr_questions": results["hr_questions"],
+            "tech_questions": results["tech_questions"]
+        }
+        tmp_path = f"{META_FILE}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(_dumps(meta, indent=True))
+        os.replace(tmp_path, META_FILE)
+        # Start a fresh answers log for the new interview
+        open(ANSWERS_FILE, "wb").close()
+        logger.info("Interview metadata saved successfully")
+        return True
+    except (IOError, TypeError, KeyError) as e:
+        logger.error(f"Failed to save interview metadata: {str(e)}")
+        st.error("Failed to save interview results.")
+        return False
+
+def append_answer(round_prefix: str, idx: int, record: dict) -> bool:
+    """
+    Append a single evaluated answer to the answers log.
+    
+    Each save writes one JSON line, so the cost does not grow with the
+    number of questions already answered.
+    
+    Args:
+        round_prefix (str): Round key prefix ("hr" or "tech")
+        idx (int): Index of the question within the round
+        record (dict): Question, answer and evaluation for this question
         
-    Raises:
-        IOError: If there's an issue writing to the file
-        TypeError: If results can't be serialized to JSON
+    Returns:
+        bool: True if save was successful, False otherwise
     """
     try:
-        with open("interview_results.json", "w") as f:
-            json.dump(results, f, indent=2)
-        logger.info("Results saved successfully")
+        line = _dumps({"round": round_prefix, "idx": idx, **record})
+        with open(ANSWERS_FILE, "ab") as f:
+            f.write(line + b"\n")
         return True
     except (IOError, TypeError) as e:
-        logger.error(f"Failed to save results: {str(e)}")
-        st.error("Failed to save interview results.")
+        logger.error(f"Failed to save answer: {str(e)}")
         return False
 
+def prepare_questions(domain: str) -> Tuple[List[str], List[str]]:
+    """
+    Generate HR and technical questions for a domain.
+    
+    Both rounds are requested in a single Groq call. If that fails, the
+    per-round generators are used instead (see generate_per_round()).
+    
+    Args:
+        domain (str): Job domain to generate questions for
+        
+    Returns:
+        Tuple[List[str], List[str]]: HR questions and technical questions
+    """
+    try:
+        return generate_all_questions(domain)
+    except Exception as e:
+        logger.warning(f"Batched question generation failed, using per-round calls: {str(e)}")
+        return generate_per_round(domain)
+
+def generate_per_round(domain: str) -> Tuple[List[str], List[str]]:
+    """
+    Generate HR and technical questions with one Groq call per round.
+    
+    The two calls run concurrently on the shared executor, and the
+    per-round generators provide their built-in fallback questions.
+    
+    Args:
+        domain (str): Job domain to generate questions for
+        
+    Returns:
+        Tuple[List[str], List[str]]: HR questions and technical questions
+    """
+    executor = get_executor()
+    hr_future = executor.submit(hr_interview.generate_questions, domain)
+    tech_future = executor.submit(tech_interview.generate_questions, domain)
+    return hr_future.result(), tech_future.result()
+
+def prefetch_questions(domain: str) -> None:
+    """
+    Start generating questions for a predicted domain in the background.
+    
+    The pending futures are stored in session state so the questions are
+    usually ready by the time the user confirms the domain.
+    
+    Args:
+        domain (str): Predicted job domain
+    """
+    st.session_state.pending_questions = {
+        "domain": domain,
+        "future": get_executor().submit(generate_all_questions, domain)
+    }
+    logger.info(f"Prefetching questions for domain: {domain}")
+
+def collect_questions(domain: str) -> Tuple[List[str], List[str]]:
+    """
+    Return questions for a domain, reusing prefetched results when possible.
+    
+    A pending future for a different domain is cancelled and the questions
+    are generated afresh. If the prefetched batched call failed, the
+    per-round generators are used instead.
+    
+    Args:
+        domain (str): Confirmed job domain
+        
+    Returns:
+        Tuple[List[str], List[str]]: HR questions and technical questions
+    """
+    pending = st.session_state.pop("pending_questions", None)
+    if pending:
+        if pending["domain"] == domain:
+            try:
+                return pending["future"].result()
+            except Exception as e:
+                logger.warning(f"Prefetched question generation failed, using per-round calls: {str(e)}")
+                return generate_per_round(domain)
+        pending["future"].cancel()
+        logger.info(f"Discarded prefetched questions for domain: {pending['domain']}")
+    return prepare_questions(domain)
+
 def initialize_session_state() -> None:
     """
     Initialize all required session state variables with default values.
     
     This function ensures all required keys exist in the session state
-    with appropriate default values. It handles nested dictionaries properly.
+    with appropriate default values. It runs on every rerun, so the nested
+    results dict is only built when it is actually missing.
     
     Raises:
         RuntimeError: If session state initialization fails
     """
     try:
-        required_state = {
-            'results': {
+        if 'results' not in st.session_state:
+            st.session_state.results = {
                 "domain": "",
                 "hr_questions": [],
-                "tech_questions": [],  
+                "tech_questions": [],
                 "hr_results": [],
-                "tech_results": []     
-            },
-            'current_round': None,
-            'current_question_idx': 0,
-            'audio_data': None,
-            'show_evaluation': False
-        }
-        
-        for key, default_value in required_state.items():
-            if key not in st.session_state:
-                if isinstance(default_value, dict):
-                    st.session_state[key] = default_value.copy()
-                else:
-                    st.session_state[key] = default_value
+                "tech_results": []
+            }
+        st.session_state.setdefault('current_round', None)
+        st.session_state.setdefault('current_question_idx', 0)
+        st.session_state.setdefault('audio_data', None)
+        st.session_state.setdefault('show_evaluation', False)
         logger.debug("Session state initialized successfully")
     except Exception as e:
         logger.critical(f"Session state initialization failed: {str(e)}")
         raise RuntimeError("Failed to initialize application state")
 
+@st.fragment
+def _question_view(round_type: str, domain: str, round_prefix: str) -> None:
+    """
+    Show the current question with its recorder, or its evaluation.
+    
+    Runs as a fragment so submitting, re-recording and moving between
+    questions only rerun this block instead of the whole app. The question
+    index is read from session state because fragment reruns reuse the
+    arguments of the original call.
+    
+    Args:
+        round_type (str): Type of round ("HR" or "Technical")
+        domain (str): Job domain being interviewed for
+        round_prefix (str): Session results key prefix ("hr" or "tech")
+    
+    Failures are handled here rather than raised: on a fragment rerun the
+    round handler's error handling does not run.
+    """
+    try:
+        results = st.session_state.results
+        questions = results[f"{round_prefix}_questions"]
+        records = results[f"{round_prefix}_results"]
+        current_idx = st.session_state.current_question_idx
+        
+        question = questions[current_idx]
+        
+        if not st.session_state.show_evaluation:
+            # Question and recording section
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Displaying question {current_idx+1}/{len(questions)}")
+            st.subheader(f"Question {current_idx+1} of {len(questions)}")
+            st.markdown(f"**{question}**")
+            
+            # Voice recording section
+            try:
+                audio_data = voice_processor.record_audio(f"{round_type}_{current_idx}")
+            except Exception as e:
+                logger.error(f"Audio recording failed: {str(e)}")
+                st.error("Failed to record audio. Please try again.")
+                return
+            
+            if audio_data:
+                st.session_state.audio_data = audio_data
+                
+                # Warm the evaluation client while the user reviews the recording
+                warm_key = f"{round_type}_{current_idx}"
+                if st.session_state.get("warmed_question") != warm_key:
+                    st.session_state.warmed_question = warm_key
+                    interviewer = hr_interview if round_type == "HR" else tech_interview
+                    get_executor().submit(interviewer.warm_up)
+                st.audio(audio_data['bytes'], format="audio/wav")
+                
+                if st.button("Submit Answer", key=f"submit_{current_idx}"):
+                    with st.spinner("Processing your answer..."):
+                        try:
+                            transcription = voice_processor.transcribe_audio(audio_data)
+                        except Exception as e:
+                            logger.error(f"Audio transcription failed: {str(e)}")
+                            st.error("Failed to transcribe your answer. Please try again.")
+                            return
+                        
+                        if transcription:
+                            # Save results using consistent key
+                            records.append({
+                                "question": question,
+                                "answer": transcription,
+                                "evaluation": None
+                            })
+                            
+                            # Evaluate answer
+                            try:
+                                if round_type == "HR":
+                                    evaluation = hr_interview.evaluate_answer(question, transcription)
+                                else:
+                                    evaluation = tech_interview.evaluate_answer(question, transcription, domain)
+                            except Exception as e:
+                                logger.error(f"Answer evaluation failed: {str(e)}")
+                                st.error("Failed to evaluate your answer. Please try again.")
+                                return
+                            
+                            # Update the evaluation in results
+                            records[-1]["evaluation"] = evaluation
+                            if not append_answer(round_prefix, current_idx, records[-1]):
+                                # A toast survives the rerun below, unlike st.error
+                                st.toast("Your answer couldn't be saved to disk; it is kept for this session.")
+                            st.session_state.show_evaluation = True
+                            logger.info(f"Question {current_idx+1} evaluation completed")
+                            st.rerun(scope="fragment")
+            
+                if st.button("Re-record", key=f"rerecord_{current_idx}"):
+                    st.session_state.audio_data = None
+                    st.rerun(scope="fragment")
+        else:
+            # Evaluation display section
+            evaluation = records[-1]["evaluation"]
+            
+            st.subheader("Your Answer Evaluation")
+            st.metric("Score", f"{evaluation['score']}/10")
+            
+            st.write("**Feedback:**")
+            st.write(evaluation.get('feedback', 'No feedback available'))
+            
+            if 'improvement_tips' in evaluation:
+                st.write("**Improvement Tips:**")
+                for tip in evaluation['improvement_tips']:
+                    st.write(f"- {tip}")
+            
+            if 'knowledge_gaps' in evaluation:
+                st.write("**Knowledge Gaps:**")
+                for gap in evaluation['knowledge_gaps']:
+                    st.write(f"- {gap}")
+            
+            st.progress(evaluation['score']/10)
+            
+            # Next question button
+            if st.button("Next Question", key=f"next_{current_idx}"):
+                st.session_state.current_question_idx += 1
+                st.session_state.audio_data = None
+                st.session_state.show_evaluation = False
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Moving to question {st.session_state.current_question_idx+1}")
+                # Finishing the round changes the page outside this fragment
+                if st.session_state.current_question_idx < len(questions):
+                    st.rerun(scope="fragment")
+                else:
+                    st.rerun()
+    except Exception as e:
+        logger.critical(f"{round_type} question view failed: {str(e)}")
+        st.error(f"{round_type} round encountered an error. Please start a new interview.")
+        if st.button("Start New Interview", key=f"reset_{round_prefix}"):
+            for key in list(st.session_state.keys()):
+                del st.session_state[key]
+            st.rerun()
+
 def conduct_round(round_type: str, domain: str) -> None:
     """
     Conduct an interview round (HR or Technical) one question at a time.
@@ -115,102 +414,11 @@ def conduct_round(round_type: str, domain: str) -> None:
         # Use consistent key naming throughout
         round_prefix = "tech" if round_type.lower() == "technical" else "hr"
         question_key = f"{round_prefix}_questions"
-        results_key = f"{round_prefix}_results"
         
-        questions = st.session_state.results[question_key]
-        current_idx = st.session_state.current_question_idx
-        
-        if current_idx < len(questions):
-            question = questions[current_idx]
-            
-            if not st.session_state.show_evaluation:
-                # Question and recording section
-                logger.debug(f"Displaying question {current_idx+1}/{len(questions)}")
-                st.subheader(f"Question {current_idx+1} of {len(questions)}")
-                st.markdown(f"**{question}**")
-                
-                # Voice recording section
-                try:
-                    audio_data = voice_processor.record_audio(f"{round_type}_{current_idx}")
-                except Exception as e:
-                    logger.error(f"Audio recording failed: {str(e)}")
-                    st.error("Failed to record audio. Please try again.")
-                    return
-                
-                if audio_data:
-                    st.session_state.audio_data = audio_data
-                    st.audio(audio_data['bytes'], format="audio/wav")
-                    
-                    if st.button("Submit Answer", key=f"submit_{current_idx}"):
-                        with st.spinner("Processing your answer..."):
-                            try:
-                                transcription = voice_processor.transcribe_audio(audio_data)
-                            except Exception as e:
-                                logger.error(f"Audio transcription failed: {str(e)}")
-                                st.error("Failed to transcribe your answer. Please try again.")
-                                return
-                            
-                            if transcription:
-                                # Save results using consistent key
-                                st.session_state.results[results_key].append({
-                                    "question": question,
-                                    "answer": transcription,
-                                    "evaluation": None
-                                })
-                                
-                                # Evaluate answer
-                                try:
-                                    if round_type == "HR":
-                                        evaluation = hr_interview.evaluate_answer(question, transcription)
-                                    else:
-                                        evaluation = tech_interview.evaluate_answer(question, transcription, domain)
-                                except Exception as e:
-                                    logger.error(f"Answer evaluation failed: {str(e)}")
-                                    st.error("Failed to evaluate your answer. Please try again.")
-                                    return
-                                
-                                # Update the evaluation in results
-                                st.session_state.results[results_key][-1]["evaluation"] = evaluation
-                                st.session_state.show_evaluation = True
-                                logger.info(f"Question {current_idx+1} evaluation completed")
-                                st.rerun()
-                
-                    if st.button("Re-record", key=f"rerecord_{current_idx}"):
-                        st.session_state.audio_data = None
-                        st.rerun()
-            else:
-                # Evaluation display section
-                evaluation = st.session_state.results[results_key][-1]["evaluation"]
-                
-                st.subheader("Your Answer Evaluation")
-                st.metric("Score", f"{evaluation['score']}/10")
-                
-                st.write("**Feedback:**")
-                st.write(evaluation.get('feedback', 'No feedback available'))
-                
-                if 'improvement_tips' in evaluation:
-                    st.write("**Improvement Tips:**")
-                    for tip in evaluation['improvement_tips']:
-                        st.write(f"- {tip}")
-                
-                if 'knowledge_gaps' in evaluation:
-                    st.write("**Knowledge Gaps:**")
-                    for gap in evaluation['knowledge_gaps']:
-                        st.write(f"- {gap}")
-                
-                st.progress(evaluation['score']/10)
-                
-                # Next question button
-                if st.button("Next Question", key=f"next_{current_idx}"):
-                    st.session_state.current_question_idx += 1
-                    st.session_state.audio_data = None
-                    st.session_state.show_evaluation = False
-                    logger.debug(f"Moving to question {st.session_state.current_question_idx+1}")
-                    st.rerun()
+        if st.session_state.current_question_idx < len(st.session_state.results[question_key]):
+            _question_view(round_type, domain, round_prefix)
         else:
             st.success(f"{round_type} Round Completed!")
-            if not save_results(st.session_state.results):
-                return
             
             if round_type == "HR":
                 if st.button("Continue to Technical Round"):
@@ -228,12 +436,203 @@ def conduct_round(round_type: str, domain: str) -> None:
         logger.critical(f"{round_type} round failed: {str(e)}")
         raise RuntimeError(f"Failed to conduct {round_type} round")
 
+def _render_home() -> None:
+    """
+    Render the home page and predict the job domain from a description.
+    """
+    logger.debug("Displaying home page")
+    st.title("EVALIA")
+    st.subheader("AI Interview Prep Friend !")
+    st.write("Upload a job description to get started")
+    
+    job_description = st.text_area("Paste Job Description Here", height=200, key="jd_input")
+    
+    if st.button("Analyze Job Description"):
+        if job_description.strip():
+            # Add validation checks
+            if len(job_description.split()) < 5:
+                st.error("Please enter a proper job description (at least 5 words)")
+                logger.warning("Job description too short")
+            elif _ALPHA_RE.search(job_description) is None:
+                st.error("Please enter meaningful text, not just numbers/symbols")
+                logger.warning("Job description contains no alphabetic characters")
+            elif len(job_description) < 30:
+                st.error("Description too short - please provide more details")
+                logger.warning("Job description character count too low")
+            else:
+                with st.spinner("Analyzing job description..."):
+                    try:
+                        predicted_domain = predict_domain(job_description)
+                        if not predicted_domain or predicted_domain.lower() == "unknown":
+                            st.error("Couldn't identify a valid domain - please provide a clearer job description")
+                            logger.warning("Domain prediction returned unknown")
+                        else:
+                            st.session_state.results["domain"] = predicted_domain
+                            prefetch_questions(predicted_domain)
+                            st.session_state.current_round = "domain_confirmation"
+                            logger.info(f"Predicted domain: {predicted_domain}")
+                            st.rerun()
+                    except Exception as e:
+                        logger.error(f"Domain prediction failed: {str(e)}")
+                        st.error(f"Analysis failed: {str(e)}")
+        else:
+            st.error("Please enter a job description")
+            logger.warning("Empty job description submitted")
+
+def _render_confirm() -> None:
+    """
+    Ask the user to confirm the predicted job domain.
+    """
+    logger.debug("Displaying domain confirmation")
+    st.title("Confirm Job Domain")
+    domain = st.session_state.results["domain"]
+    st.success(f"Identified Domain: **{domain}**")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        if st.button("✅ Yes, this is correct", use_container_width=True):
+            # Generate questions for both rounds
+            with st.spinner("Preparing interview questions..."):
+                try:
+                    hr_questions, tech_questions = collect_questions(domain)
+                    st.session_state.results["hr_questions"] = hr_questions
+                    st.session_state.results["tech_questions"] = tech_questions
+                    if not save_interview_meta(st.session_state.results):
+                        return
+                    st.session_state.current_round = "hr_round"
+                    logger.info(f"Generated questions for domain: {domain}")
+                    st.rerun()
+                except Exception as e:
+                    logger.error(f"Question generation failed: {str(e)}")
+                    st.error("Failed to generate interview questions. Please try again.")
+    
+    with col2:
+        if st.button("✏️ No, let me edit", use_container_width=True):
+            st.session_state.current_round = "domain_edit"
+            logger.info("User requested domain edit")
+            st.rerun()
+
+def _render_edit() -> None:
+    """
+    Let the user correct the job domain before questions are generated.
+    """
+    logger.debug("Displaying domain editing")
+    st.title("Enter Correct Job Domain")
+    new_domain = st.text_input("Job Domain/Title", value=st.session_state.results["domain"])
+    
+    if st.button("Confirm Domain"):
+        if new_domain.strip():
+            st.session_state.results["domain"] = new_domain
+            # Generate questions for both rounds
+            with st.spinner("Preparing interview questions..."):
+                try:
+                    hr_questions, tech_questions = collect_questions(new_domain)
+                    st.session_state.results["hr_questions"] = hr_questions
+                    st.session_state.results["tech_questions"] = tech_questions
+                    if not save_interview_meta(st.session_state.results):
+                        return
+                    st.session_state.current_round = "hr_round"
+                    st.session_state.current_question_idx = 0
+                    logger.info(f"User updated domain to: {new_domain}")
+                    st.rerun()
+                except Exception as e:
+                    logger.error(f"Question generation failed for edited domain: {str(e)}")
+                    st.error("Failed to generate interview questions. Please try again.")
+        else:
+            st.error("Please enter a domain/title")
+            logger.warning("Empty domain submitted during edit")
+
+def _render_hr() -> None:
+    """
+    Run the HR interview round.
+    """
+    try:
+        domain = st.session_state.results["domain"]
+        conduct_round("HR", domain)
+    except Exception as e:
+        logger.critical(f"HR round failed: {str(e)}")
+        st.error("HR round encountered an error. Please start a new interview.")
+        if st.button("Start New Interview"):
+            for key in list(st.session_state.keys()):
+                del st.session_state[key]
+            st.rerun()
+
+def _render_tech() -> None:
+    """
+    Run the technical interview round.
+    """
+    try:
+        domain = st.session_state.results["domain"]
+        conduct_round("Technical", domain)
+    except Exception as e:
+        logger.critical(f"Technical round failed: {str(e)}")
+        st.error("Technical round encountered an error. Please start a new interview.")
+        if st.button("Start New Interview"):
+            for key in list(st.session_state.keys()):
+                del st.session_state[key]
+            st.rerun()
+
+def _render_dashboard() -> None:
+    """
+    Show the results dashboard and next-step options.
+    """
+    try:
+        display_dashboard(st.session_state.results)
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.button("Start New Interview"):
+                # Reset session state
+                for key in list(st.session_state.keys()):
+                    del st.session_state[key]
+                logger.info("Starting new interview session")
+                st.rerun()
+        
+        with col2:
+            if st.button("Talk to Evalia"):
+                st.session_state.current_round = "chatbot"
+                logger.info("Transitioning to chatbot")
+                st.rerun()
+    except Exception as e:
+        logger.error(f"Dashboard display failed: {str(e)}")
+        st.error("Failed to display results dashboard.")
+
+def _render_chatbot() -> None:
+    """
+    Show the Evalia chatbot until it asks to return to the dashboard.
+    """
+    try:
+        # Run chatbot and check if it wants to return
+        should_return = chatbot_page()
+        
+        if should_return:
+            st.session_state.current_round = "dashboard"
+            logger.info("Returning from chatbot to dashboard")
+            st.rerun()
+    except Exception as e:
+        logger.error(f"Chatbot failed: {str(e)}")
+        st.error("Chatbot encountered an error. Returning to dashboard.")
+        st.session_state.current_round = "dashboard"
+        st.rerun()
+
+# Interview stage -> page handler, keyed by st.session_state.current_round
+_HANDLERS = {
+    None: _render_home,
+    "domain_confirmation": _render_confirm,
+    "domain_edit": _render_edit,
+    "hr_round": _render_hr,
+    "tech_round": _render_tech,
+    "dashboard": _render_dashboard,
+    "chatbot": _render_chatbot
+}
+
 def main() -> None:
     """
     Main application function that controls the interview flow.
     
     Handles page routing, state management, and the overall interview process.
-    Implements a finite state machine pattern for interview stages.
+    Implements a finite state machine pattern for interview stages: each
+    stage is rendered by its handler in _HANDLERS.
     """
     try:
         st.set_page_config(page_title="EVALIA", layout="wide")
@@ -242,163 +641,12 @@ def main() -> None:
         # Initialize session state - MUST be first operation
         initialize_session_state()
         
-        # Home Page - Domain Identification
-        if st.session_state.current_round is None:
-            logger.debug("Displaying home page")
-            st.title("EVALIA")
-            st.subheader("AI Interview Prep Friend !")
-            st.write("Upload a job description to get started")
-            
-            job_description = st.text_area("Paste Job Description Here", height=200, key="jd_input")
-            
-            if st.button("Analyze Job Description"):
-                if job_description.strip():
-                    # Add validation checks
-                    if len(job_description.split()) < 5:
-                        st.error("Please enter a proper job description (at least 5 words)")
-                        logger.warning("Job description too short")
-                    elif not any(char.isalpha() for char in job_description):
-                        st.error("Please enter meaningful text, not just numbers/symbols")
-                        logger.warning("Job description contains no alphabetic characters")
-                    elif len(job_description) < 30:
-                        st.error("Description too short - please provide more details")
-                        logger.warning("Job description character count too low")
-                    else:
-                        with st.spinner("Analyzing job description..."):
-                            try:
-                                predicted_domain = predict_domain(job_description)
-                                if not predicted_domain or predicted_domain.lower() == "unknown":
-                                    st.error("Couldn't identify a valid domain - please provide a clearer job description")
-                                    logger.warning("Domain prediction returned unknown")
-                                else:
-                                    st.session_state.results["domain"] = predicted_domain
-                                    st.session_state.current_round = "domain_confirmation"
-                                    logger.info(f"Predicted domain: {predicted_domain}")
-                                    st.rerun()
-                            except Exception as e:
-                                logger.error(f"Domain prediction failed: {str(e)}")
-                                st.error(f"Analysis failed: {str(e)}")
-                else:
-                    st.error("Please enter a job description")
-                    logger.warning("Empty job description submitted")
-        
-        # Domain Confirmation
-        elif st.session_state.current_round == "domain_confirmation":
-            logger.debug("Displaying domain confirmation")
-            st.title("Confirm Job Domain")
-            domain = st.session_state.results["domain"]
-            st.success(f"Identified Domain: **{domain}**")
-            
-            col1, col2 = st.columns(2)
-            with col1:
-                if st.button("✅ Yes, this is correct", use_container_width=True):
-                    # Generate questions for both rounds
-                    with st.spinner("Preparing interview questions..."):
-                        try:
-                            st.session_state.results["hr_questions"] = hr_interview.generate_questions(domain)
-                            st.session_state.results["tech_questions"] = tech_interview.generate_questions(domain)
-                            st.session_state.current_round = "hr_round"
-                            logger.info(f"Generated questions for domain: {domain}")
-                            st.rerun()
-                        except Exception as e:
-                            logger.error(f"Question generation failed: {str(e)}")
-                            st.error("Failed to generate interview questions. Please try again.")
-            
-            with col2:
-                if st.button("✏️ No, let me edit", use_container_width=True):
-                    st.session_state.current_round = "domain_edit"
-                    logger.info("User requested domain edit")
-                    st.rerun()
-        
-        # Domain Editing
-        elif st.session_state.current_round == "domain_edit":
-            logger.debug("Displaying domain editing")
-            st.title("Enter Correct Job Domain")
-            new_domain = st.text_input("Job Domain/Title", value=st.session_state.results["domain"])
-            
-            if st.button("Confirm Domain"):
-                if new_domain.strip():
-                    st.session_state.results["domain"] = new_domain
-                    # Generate questions for both rounds
-                    with st.spinner("Preparing interview questions..."):
-                        try:
-                            st.session_state.results["hr_questions"] = hr_interview.generate_questions(new_domain)
-                            st.session_state.results["tech_questions"] = tech_interview.generate_questions(new_domain)
-                            st.session_state.current_round = "hr_round"
-                            st.session_state.current_question_idx = 0
-                            logger.info(f"User updated domain to: {new_domain}")
-                            st.rerun()
-                        except Exception as e:
-                            logger.error(f"Question generation failed for edited domain: {str(e)}")
-                            st.error("Failed to generate interview questions. Please try again.")
-                else:
-                    st.error("Please enter a domain/title")
-                    logger.warning("Empty domain submitted during edit")
-        
-        # HR Round
-        elif st.session_state.current_round == "hr_round":
-            try:
-                domain = st.session_state.results["domain"]
-                conduct_round("HR", domain)
-            except Exception as e:
-                logger.critical(f"HR round failed: {str(e)}")
-                st.error("HR round encountered an error. Please start a new interview.")
-                if st.button("Start New Interview"):
-                    for key in list(st.session_state.keys()):
-                        del st.session_state[key]
-                    st.rerun()
-        
-        # Technical Round
-        elif st.session_state.current_round == "tech_round":
-            try:
-                domain = st.session_state.results["domain"]
-                conduct_round("Technical", domain)
-            except Exception as e:
-                logger.critical(f"Technical round failed: {str(e)}")
-                st.error("Technical round encountered an error. Please start a new interview.")
-                if st.button("Start New Interview"):
-                    for key in list(st.session_state.keys()):
-                        del st.session_state[key]
-                    st.rerun()
-        
-        # Dashboard
-        elif st.session_state.current_round == "dashboard":
-            try:
-                display_dashboard(st.session_state.results)
-                
-                col1, col2 = st.columns(2)
-                with col1:
-                    if st.button("Start New Interview"):
-                        # Reset session state
-                        for key in list(st.session_state.keys()):
-                            del st.session_state[key]
-                        logger.info("Starting new interview session")
-                        st.rerun()
-                
-                with col2:
-                    if st.button("Talk to Evalia"):
-                        st.session_state.current_round = "chatbot"
-                        logger.info("Transitioning to chatbot")
-                        st.rerun()
-            except Exception as e:
-                logger.error(f"Dashboard display failed: {str(e)}")
-                st.error("Failed to display results dashboard.")
-
-        # Chatbot
-        elif st.session_state.current_round == "chatbot":
-            try:
-                # Run chatbot and check if it wants to return
-                should_return = chatbot_page()
-                
-                if should_return:
-                    st.session_state.current_round = "dashboard"
-                    logger.info("Returning from chatbot to dashboard")
-                    st.rerun()
-            except Exception as e:
-                logger.error(f"Chatbot failed: {str(e)}")
-                st.error("Chatbot encountered an error. Returning to dashboard.")
-                st.session_state.current_round = "dashboard"
-                st.rerun()
+        handler = _HANDLERS.get(st.session_state.current_round)
+        if handler is None:
+            logger.warning(f"Unknown interview stage {st.session_state.current_round!r}, returning home")
+            st.session_state.current_round = None
+            handler = _render_home
+        handler()
 
     except Exception as e:
         logger.critical(f"Application crashed: {str(e)}")
@@ -0,0 +1,58 @@
+import json
+from typing import List, Tuple
+from groq_client import get_client
+
+def _clean(questions, num_questions: int) -> List[str]:
+    """
+    Keep non-empty question strings, capped at num_questions
+    Raises:
+        ValueError: If questions is not a list
+    """
+    if not isinstance(questions, list):
+        raise ValueError(f"Expected a list of questions, got {type(questions).__name__}")
+    cleaned = [q.strip() for q in questions if isinstance(q, str) and q.strip()]
+    return cleaned[:num_questions]
+
+def generate_all_questions(domain: str, difficulty: str = "mid", num_questions: int = 5) -> Tuple[List[str], List[str]]:
+    """
+    Generate HR and technical interview questions in a single Groq call
+    Args:
+        domain: Job domain (e.g. "Software Engineering")
+        difficulty: Difficulty level of the technical questions
+        num_questions: Number of questions to generate per round
+    Returns:
+        Tuple of (HR questions, technical questions)
+    Raises:
+        ValueError: If the response is not a JSON object with "hr" and "tech"
+            lists holding enough question strings for both rounds
+    """
+    response = get_client().chat.completions.create(
+        model="llama-3.1-8b-instant",
+        messages=[
+            {
+                "role": "system",
+                "content": "You are an expert HR and technical interviewer. Return ONLY a JSON object, no additional text."
+            },
+            {
+                "role": "user",
+                "content": f"""Generate interview questions for a {domain} candidate.
+                - "hr": exactly {num_questions} basic HR and behavioral questions. First question should be self introduction.
+                - "tech": exactly {num_questions} {difficulty}-level technical questions for {domain}.
+                Format as JSON with keys "hr" and "tech", each an array of question strings.
+                Example:
+                {{"hr": ["Tell me about yourself", "..."], "tech": ["Explain the CAP theorem", "..."]}}"""
+            }
+        ],
+        response_format={"type": "json_object"},
+        temperature=0.7,
+        max_tokens=1200
+    )
+
+    data = json.loads(response.choices[0].message.content)
+    if not isinstance(data, dict):
+        raise ValueError("Expected a JSON object with 'hr' and 'tech' keys")
+    hr_questions = _clean(data.get("hr"), num_questions)
+    tech_questions = _clean(data.get("tech"), num_questions)
+    if len(hr_questions) < num_questions or len(tech_questions) < num_questions:
+        raise ValueError("Incomplete question set returned by model")
+    return hr_questions, tech_questions
@@ -126,6 +126,16 @@ class TechnicalInterview:
                 "knowledge_gaps": ["Unable to assess gaps"]
             }
 
+    def warm_up(self) -> None:
+        """
+        Pre-open the Groq connection used by evaluate_answer()
+        Runs on a worker thread once a technical answer has been recorded
+        """
+        try:
+            self.client.models.list()
+        except Exception as e:
+            print(f"Error warming up technical client: {str(e)}")
+
     def _parse_evaluation(self, text: str) -> Dict:
         """
         Parse LLM evaluation response into structured format